@@ -1,5 +1,7 @@
 import os
+import sys
 import json
+import orjson
 import logging
 from typing import Dict, Any, List, Optional
 from pathlib import Path
@@ -8,8 +10,8 @@ from pydantic import BaseModel
 
 from agents.base_agent import BaseAgent
 from models.test_case import (
-    AgentResponse, TestSuite, TestCase, ProcessedVideo, 
-    RAGQuery, TestType, Priority
+    AgentResponse, TestSuite, TestCase, TestStep, ProcessedVideo, 
+    RAGQuery, TestType, Priority, TEST_CASE_ADAPTER, TEST_SUITE_ADAPTER
 )
 from core.rag_engine import RAGEngine
 from core.test_case_generator import TestCaseGenerator
@@ -25,6 +27,7 @@ class ProcessingMode(Enum):
     GENERATE_TEST_CASES = "generate_test_cases"
     GENERATE_SCRIPTS = "generate_scripts"
     FULL_PIPELINE = "full_pipeline"
+    BATCH_TEST_CASES = "batch_test_cases"
 
 class TestGeneratorAgent(BaseAgent):
     """Agent responsible for generating test cases from video content using RAG"""
@@ -100,6 +103,7 @@ class TestGeneratorAgent(BaseAgent):
                 - For test case generation: 'processed_video' and optional 'requirements'
                 - For script generation: 'test_cases' and optional 'output_dir'
                 - For full pipeline: 'processed_video' and optional 'requirements'
+                - For batch test case generation: 'processed_videos' and optional 'requirements'
         """
         try:
             # Validate input
@@ -127,6 +131,8 @@ class TestGeneratorAgent(BaseAgent):
                 return self._process_script_generation(input_data, test_type)
             elif mode == ProcessingMode.FULL_PIPELINE:
                 return self._process_full_pipeline(input_data, test_type)
+            elif mode == ProcessingMode.BATCH_TEST_CASES:
+                return self._process_batch_test_case_generation(input_data, test_type)
             else:
                 return self.create_error_response(f"Unsupported mode: {mode}")
             
@@ -158,7 +164,7 @@ class TestGeneratorAgent(BaseAgent):
             self.rag_engine.add_video_segments(processed_video)
             
             # Save vector store with error handling
-            print("Attempting to save vector store")  # Debug
+            self.logger.debug("Attempting to save vector store")
             try:
                 self.rag_engine.save_vector_store()
                 self.logger.info("Vector store saved successfully")
@@ -166,40 +172,100 @@ class TestGeneratorAgent(BaseAgent):
                 self.logger.warning(f"Failed to save vector store: {save_error}")
                 raise
             
-            # Generate test cases
-            additional_requirements = input_data.get('requirements', {})
-            test_suite = self.generate_test_suite(processed_video, additional_requirements, test_type)
+            # Generate and save test cases
+            return self._generate_and_save_test_suite(processed_video, input_data.get('requirements', {}), test_type)
             
-            # Save test suite
-            output_path = self.save_test_suite(test_suite)
+        except Exception as e:
+            error_msg = f"Test case generation failed: {str(e)}"
+            self.stats['errors'].append(error_msg)
+            self.logger.error(error_msg)
+            raise
+    
+    def _generate_and_save_test_suite(self, processed_video: ProcessedVideo,
+                                      additional_requirements: Dict[str, Any],
+                                      test_type: str = 'recruter_ai') -> AgentResponse:
+        """Generate, save and report the test suite for a video already added to the RAG engine"""
+        # Generate test cases
+        test_suite = self.generate_test_suite(processed_video, additional_requirements, test_type)
+        
+        # Save test suite
+        output_path = self.save_test_suite(test_suite)
+        
+        # Update stats
+        self.stats['test_cases_generated'] += len(test_suite.test_cases)
+        self.stats['last_run'] = datetime.now().isoformat()
+        
+        self.log_operation(
+            "test_cases_generated",
+            {
+                'test_suite_id': test_suite.id,
+                'test_count': len(test_suite.test_cases),
+                'test_type': test_type,
+                'output_path': str(output_path)
+            }
+        )
+        
+        return self.create_success_response(
+            f"Generated {len(test_suite.test_cases)} test cases from video content for {test_type}",
+            {
+                'test_suite': test_suite.dict(),
+                'output_path': str(output_path),
+                'test_type': test_type,
+                'rag_stats': self.rag_engine.get_stats(),
+                'mode': 'test_case_generation'
+            }
+        )
+    
+    def _process_batch_test_case_generation(self, input_data: Dict[str, Any], test_type: str = 'recruter_ai') -> AgentResponse:
+        """Generate test cases for several videos, writing the vector store once for the whole batch"""
+        try:
+            processed_videos_data = input_data.get('processed_videos')
+            if not processed_videos_data:
+                return self.create_error_response("Missing 'processed_videos' in input")
+            
+            processed_videos = []
+            for processed_video_data in processed_videos_data:
+                if isinstance(processed_video_data, dict):
+                    processed_videos.append(ProcessedVideo(**processed_video_data))
+                elif isinstance(processed_video_data, ProcessedVideo):
+                    processed_videos.append(processed_video_data)
+                else:
+                    return self.create_error_response("Invalid processed_video format")
             
-            # Update stats
-            self.stats['test_cases_generated'] += len(test_suite.test_cases)
-            self.stats['last_run'] = datetime.now().isoformat()
+            # Index every video before generating so the vector store is saved once
+            for processed_video in processed_videos:
+                self.logger.info(f"Adding video content to RAG engine: {processed_video.title}")
+                self.rag_engine.add_video_segments(processed_video)
             
-            self.log_operation(
-                "test_cases_generated",
-                {
-                    'test_suite_id': test_suite.id,
-                    'test_count': len(test_suite.test_cases),
-                    'test_type': test_type,
-                    'output_path': str(output_path)
-                }
-            )
+            self.rag_engine.save_vector_store()
+            self.logger.info("Vector store saved successfully")
             
+            # One response per video, in input order; a failing video does not stop the batch
+            additional_requirements = input_data.get('requirements', {})
+            responses = []
+            for processed_video in processed_videos:
+                try:
+                    responses.append(
+                        self._generate_and_save_test_suite(processed_video, additional_requirements, test_type)
+                    )
+                except Exception as e:
+                    error_msg = f"Test case generation failed for {processed_video.url}: {str(e)}"
+                    self.stats['errors'].append(error_msg)
+                    self.logger.error(error_msg)
+                    responses.append(self.create_error_response(error_msg))
+            
+            succeeded = sum(1 for response in responses if response.success)
             return self.create_success_response(
-                f"Generated {len(test_suite.test_cases)} test cases from video content for {test_type}",
+                f"Generated test cases for {succeeded}/{len(responses)} videos for {test_type}",
                 {
-                    'test_suite': test_suite.dict(),
-                    'output_path': str(output_path),
+                    'responses': [response.dict() for response in responses],
                     'test_type': test_type,
-                    'rag_stats': self.rag_engine.get_stats(),
-                    'mode': 'test_case_generation'
+                    'mode': 'batch_test_case_generation'
                 }
             )
             
         except Exception as e:
-            error_msg = f"Test case generation failed: {str(e)}"
+            error_msg = f"Batch test case generation failed: {str(e)}"
             self.stats['errors'].append(error_msg)
             self.logger.error(error_msg)
             raise
@@ -227,8 +293,8 @@ class TestGeneratorAgent(BaseAgent):
                     else:
                         # Try to create TestCase and then convert to dict
                         try:
-                            test_case_obj = TestCase(**tc)
-                            processed_test_cases.append(test_case_obj.dict())
+                            test_case_obj = TEST_CASE_ADAPTER.validate_python(tc)
+                            processed_test_cases.append(TEST_CASE_ADAPTER.dump_python(test_case_obj))
                         except Exception as e:
                             self.logger.warning(f"Failed to convert test case dict: {e}")
                             # Use the original dict if conversion fails
@@ -306,7 +372,7 @@ class TestGeneratorAgent(BaseAgent):
             if not test_suite_data:
                 return self.create_error_response("Failed to extract test suite from generation step")
             
-            test_suite = TestSuite(**test_suite_data)
+            test_suite = TEST_SUITE_ADAPTER.validate_python(test_suite_data)
             
             # Step 2: Generate scripts from test cases
             self.logger.info("Step 2: Generating Playwright scripts from test cases")
@@ -384,11 +450,19 @@ class TestGeneratorAgent(BaseAgent):
             ]:
                 generated = generator_func(processed_video, requirements)
                 for test in generated:
-                    # Convert to dict if it's a Pydantic model
+                    # Generated TestCase objects are already validated, so keep them as they are
+                    if isinstance(test, TestCase):
+                        if test.steps and all(step.action for step in test.steps):
+                            test_cases.append(test)
+                        else:
+                            self.logger.warning(f"⚠️ Invalid test case skipped: {test.id}")
+                        continue
+
+                    # Convert to dict if it's another Pydantic model
                     test_dict = test.dict() if isinstance(test, BaseModel) else test
 
                     if self._is_valid_test_case(test_dict):
-                        test_cases.append(TestCase(**test_dict))
+                        test_cases.append(TEST_CASE_ADAPTER.validate_python(test_dict))
                     else:
                         self.logger.warning(f"⚠️ Invalid test case skipped: {test_dict.get('id', 'unknown')}")
 
@@ -409,16 +483,17 @@ class TestGeneratorAgent(BaseAgent):
             
             # Save as JSON (will overwrite existing)
             json_path = base_path / f"{test_suite.id}.json"
-            save_json(test_suite.model_dump(), json_path)
+            suite_data = test_suite.model_dump()
+            save_json(suite_data, json_path)
             
             # Save as Markdown for human readability (will overwrite existing)
             markdown_path = base_path / f"{test_suite.id}.md"
             self.save_test_suite_markdown(test_suite, markdown_path)
             
-            # Save individual test cases (will overwrite existing)
-            for test_case in test_suite.test_cases:
-                test_case_path = base_path / f"{test_case.id}.json"
-                save_json(test_case.model_dump(), test_case_path)
+            # Save individual test cases, reusing the dicts already dumped with the suite (will overwrite existing)
+            for test_case_data in suite_data['test_cases']:
+                test_case_path = base_path / f"{test_case_data['id']}.json"
+                save_json(test_case_data, test_case_path)
             
             self.logger.info(f"Test suite saved to: {json_path}")
             return json_path
@@ -533,14 +608,37 @@ class TestGeneratorAgent(BaseAgent):
         try:
             json_path = self.test_cases_dir / test_suite_id / f"{test_suite_id}.json"
             if json_path.exists():
-                data = load_json(json_path)
-                return TestSuite(**data)
+                return self.load_trusted_test_suite(json_path)
             return None
             
         except Exception as e:
             self.logger.error(f"Error loading test suite: {e}")
             return None
     
+    def load_trusted_test_suite(self, json_path: Path) -> TestSuite:
+        """Rebuild a test suite written by save_test_suite without re-validating it"""
+        # Only for our own artifacts; external input goes through TEST_SUITE_ADAPTER
+        # model_construct skips the interning validators, so intern the repeated strings here
+        raw = orjson.loads(Path(json_path).read_bytes())
+        test_cases = [
+            TestCase.model_construct(**{
+                **test_case,
+                'test_type': sys.intern(test_case['test_type']),
+                'priority': sys.intern(test_case['priority']),
+                'tags': [sys.intern(tag) for tag in test_case.get('tags', [])],
+                'steps': [
+                    TestStep.model_construct(**{
+                        **step,
+                        'action': sys.intern(step['action']),
+                        'selector': sys.intern(step['selector'])
+                    })
+                    for step in test_case.get('steps', [])
+                ]
+            })
+            for test_case in raw.get('test_cases', [])
+        ]
+        return TestSuite.model_construct(**{**raw, 'test_cases': test_cases})
+    
     def list_test_suites(self, test_type: str = None) -> List[Dict[str, Any]]:
         """List all generated test suites, optionally filtered by test type"""
         try:
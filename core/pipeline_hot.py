@@ -0,0 +1,105 @@
+"""Segment-processing hot path of the QA pipeline, kept free of pipeline state."""
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Final, List, Set, Tuple
+
+from pydantic import TypeAdapter
+
+from models.test_case import ProcessedVideo, VideoSegment
+
+# Common UI elements to look for in transcripts
+UI_KEYWORDS: Final[Tuple[str, ...]] = (
+    'button', 'click', 'input', 'field', 'form', 'dropdown',
+    'menu', 'link', 'tab', 'page', 'screen', 'dialog',
+    'popup', 'notification', 'login', 'signup', 'dashboard',
+    'profile', 'settings', 'search', 'upload', 'download'
+)
+
+# Potential user flows mentioned in transcripts
+FLOW_KEYWORDS: Final[Tuple[str, ...]] = (
+    'sign up', 'log in', 'create account', 'fill form',
+    'submit', 'upload', 'download', 'navigate', 'search',
+    'filter', 'sort', 'select', 'choose', 'configure'
+)
+
+# Verbs that mark a transcript sentence as describing a user action
+ACTION_VERBS: Final[Tuple[str, ...]] = (
+    'click', 'tap', 'select', 'choose', 'enter', 'type', 'fill',
+    'submit', 'upload', 'download', 'navigate', 'go to', 'open',
+    'close', 'save', 'delete', 'edit', 'update', 'create', 'add'
+)
+
+def _keyword_regex(keywords: Tuple[str, ...]) -> 're.Pattern[str]':
+    """Compile keywords into one pattern matching each substring occurrence, overlapping or not"""
+    return re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+
+UI_KEYWORDS_RE: Final = _keyword_regex(UI_KEYWORDS)
+FLOW_KEYWORDS_RE: Final = _keyword_regex(FLOW_KEYWORDS)
+
+ACTION_VERBS_RE: Final = re.compile(r'\b(?:' + '|'.join(map(re.escape, ACTION_VERBS)) + r')\b', re.IGNORECASE)
+
+# Validates a whole list of segments in one pydantic-core call
+SEGMENTS_ADAPTER: Final = TypeAdapter(List[VideoSegment])
+
+@dataclass(slots=True, frozen=True)
+class _FastSegment:
+    """Lightweight segment record built in the hot loop, validated into VideoSegment in bulk"""
+    start_time: float
+    end_time: float
+    transcript: str
+    action_description: str
+    ui_elements: Tuple[str, ...]
+
+def extract_action_description(transcript_text: str) -> str:
+    """Extract actionable description from transcript text"""
+    # Simple heuristic: the first sentence that mentions an action verb
+    for sentence in transcript_text.split('.'):
+        if ACTION_VERBS_RE.search(sentence):
+            return sentence.strip()
+
+    return transcript_text[:100] + "..." if len(transcript_text) > 100 else transcript_text
+
+def build_processed_video(url: str, title: str, transcript_data: Dict[str, Any],
+                          extract_ui: bool = True) -> ProcessedVideo:
+    """Build a ProcessedVideo from transcript data, optionally extracting UI elements and flows"""
+    # Get duration from segments
+    segments: List[Dict[str, Any]] = transcript_data.get('segments', [])
+    duration: float = segments[-1]['end'] if segments else 0
+
+    found_ui: Set[str] = set()
+    found_flows: Set[str] = set()
+
+    # Create lightweight segments, then validate them all at once
+    fast_segments: List[_FastSegment] = []
+
+    for segment in segments:
+        found_ui_elements: Tuple[str, ...] = ()
+        if extract_ui:
+            # One scan per keyword set; results keep the keyword order
+            transcript_text = segment['text'].lower()
+            segment_ui = set(UI_KEYWORDS_RE.findall(transcript_text))
+            found_ui_elements = tuple(keyword for keyword in UI_KEYWORDS if keyword in segment_ui)
+            found_ui.update(segment_ui)
+            found_flows.update(FLOW_KEYWORDS_RE.findall(transcript_text))
+
+        fast_segments.append(_FastSegment(
+            start_time=segment['start'],
+            end_time=segment['end'],
+            transcript=segment['text'],
+            action_description=extract_action_description(segment['text']),
+            ui_elements=found_ui_elements
+        ))
+
+    video_segments: List[VideoSegment] = SEGMENTS_ADAPTER.validate_python(fast_segments, from_attributes=True)
+    ui_components: List[str] = [keyword for keyword in UI_KEYWORDS if keyword in found_ui]
+    extracted_flows: List[str] = [f"User can {flow}" for flow in FLOW_KEYWORDS if flow in found_flows]
+
+    return ProcessedVideo(
+        url=url,
+        title=title,
+        duration=duration,
+        full_transcript=transcript_data.get('text', ''),
+        segments=video_segments,
+        extracted_flows=extracted_flows,
+        ui_components=ui_components
+    )
@@ -1,6 +1,7 @@
 import json
 import os
 import re
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
@@ -8,6 +9,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Matches single-quoted attribute values in CSS selectors, e.g. [name='email']
+SINGLE_QUOTED_ATTR_RE = re.compile(r"=\s*'([^']*)'")
+
 class PlaywrightTestGenerator:
     """Enhanced Playwright test generator with better error handling and debugging"""
     
@@ -39,7 +43,7 @@ class PlaywrightTestGenerator:
         
         # For selectors, we need to be more careful
         # Replace single quotes with double quotes in attribute selectors
-        selector = re.sub(r"=\s*'([^']*)'", r'="\1"', selector)
+        selector = SINGLE_QUOTED_ATTR_RE.sub(r'="\1"', selector)
         
         # If the selector contains double quotes, escape them
         selector = selector.replace('"', '\\"')
@@ -636,7 +640,7 @@ module.exports = async () => {
                 'total_tests': len(test_cases),
                 'successful': 0,
                 'failed': 0,
-                'by_type': {}
+                'by_type': Counter()
             }
             
             # Generate individual test scripts
@@ -663,14 +667,17 @@ module.exports = async () => {
                     })
                     
                     generation_stats['successful'] += 1
-                    generation_stats['by_type'][test_type] = generation_stats['by_type'].get(test_type, 0) + 1
+                    generation_stats['by_type'][test_type] += 1
                     
-                    logger.info(f"Generated test script: {filename}")
+                    logger.debug(f"Generated test script: {filename}")
                     
                 except Exception as e:
                     logger.error(f"Failed to generate test {test_case.get('id', 'unknown')}: {e}")
                     generation_stats['failed'] += 1
             
+            generation_stats['by_type'] = dict(generation_stats['by_type'])
+            logger.info(f"Generated {generation_stats['successful']} test scripts in {output_path}")
+            
             # Generate configuration files
             self._generate_config_files(output_path)
             
@@ -706,15 +713,24 @@ const path = require('path');
 console.log('🎭 Recruter.ai Test Suite Runner');
 console.log('================================');
 
-// Install dependencies if needed
-try {
-    console.log('📦 Installing Playwright...');
-    execSync('npm install', { stdio: 'inherit' });
-    execSync('npx playwright install', { stdio: 'inherit' });
-    console.log('✅ Dependencies installed');
-} catch (error) {
-    console.error('❌ Failed to install dependencies:', error.message);
-    process.exit(1);
+// Install dependencies if needed (skipped once the marker file exists)
+const installMarker = path.join(__dirname, 'node_modules', '.playwright-installed');
+if (fs.existsSync(installMarker)) {
+    console.log('✅ Dependencies already installed');
+} else {
+    try {
+        console.log('📦 Installing Playwright...');
+        // npm ci is faster and deterministic, but requires a lockfile
+        const hasLockfile = fs.existsSync(path.join(__dirname, 'package-lock.json'));
+        execSync(hasLockfile ? 'npm ci' : 'npm install', { stdio: 'inherit', cwd: __dirname });
+        execSync('npx playwright install', { stdio: 'inherit', cwd: __dirname });
+        fs.mkdirSync(path.dirname(installMarker), { recursive: true });
+        fs.writeFileSync(installMarker, '');
+        console.log('✅ Dependencies installed');
+    } catch (error) {
+        console.error('❌ Failed to install dependencies:', error.message);
+        process.exit(1);
+    }
 }
 
 // Create screenshots directory
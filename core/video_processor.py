@@ -1,14 +1,38 @@
 import whisper
 import yt_dlp
 import os
-from typing import Optional, Dict
+import gc
+import json
+import asyncio
+from typing import Any, Awaitable, Callable, Optional, Dict, List
 import logging
 from config.settings import settings
+from utils.file_utils import load_msgpack, save_msgpack
 
 class VideoProcessor:
-    def __init__(self):
-        self.whisper_model = whisper.load_model("base")
+    def __init__(self, quiet: bool = False):
+        # Loaded on first transcription, so runs served from the transcript cache never load it
+        self.whisper_model = None
         self.logger = logging.getLogger(__name__)
+        # Keep yt-dlp off stdout, e.g. when stdout carries machine-readable output
+        self.quiet = quiet
+        
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Release the Whisper model; it is reloaded on the next transcription"""
+        if self.whisper_model is None:
+            return
+        self.whisper_model = None
+        gc.collect()
+        
+        import torch
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
         
     def download_youtube_video(self, url: str, output_path: str) -> Optional[str]:
         """Download YouTube video and return path to audio file"""
@@ -21,15 +45,25 @@ class VideoProcessor:
                     'preferredcodec': 'mp3',
                     'preferredquality': '192',
                 }],
+                'concurrent_fragment_downloads': 8,
+                'http_chunk_size': 10_485_760,
+                'retries': 3,
+                'quiet': self.quiet,
+                'noprogress': self.quiet,
             }
             
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
+                info = ydl.extract_info(url, download=True)
                 
-            # Find the downloaded file
-            for file in os.listdir(output_path):
-                if file.endswith('.mp3'):
-                    return os.path.join(output_path, file)
+            # Use the file yt-dlp reports for this URL; scanning the shared directory
+            # could pick up another concurrent download's audio
+            requested_downloads = info.get('requested_downloads') or []
+            audio_path = requested_downloads[0].get('filepath') if requested_downloads else None
+            if audio_path and os.path.exists(audio_path):
+                return audio_path
+            
+            self.logger.error(f"Downloaded audio not found for {url}")
+            return None
                     
         except Exception as e:
             self.logger.error(f"Error downloading video: {e}")
@@ -38,6 +72,8 @@ class VideoProcessor:
     def transcribe_video(self, video_path: str) -> Optional[Dict]:
         """Transcribe video using Whisper"""
         try:
+            if self.whisper_model is None:
+                self.whisper_model = whisper.load_model("base")
             result = self.whisper_model.transcribe(video_path)
             return {
                 'text': result['text'],
@@ -48,24 +84,88 @@ class VideoProcessor:
             self.logger.error(f"Error transcribing video: {e}")
             return None
     
+    async def process_videos(self, urls: List[str], max_concurrent_downloads: int = 4,
+                             on_transcript: Optional[Callable[[str, Optional[str], Optional[Dict]], Awaitable[Any]]] = None) -> List[Any]:
+        """Download and transcribe several videos, overlapping downloads with transcription
+        
+        Returns (audio_path, transcript) per URL, with None for the stage that failed. If on_transcript
+        is given it is awaited with (url, audio_path, transcript) as soon as each video is done, and its
+        results are returned instead.
+        """
+        download_slots = asyncio.Semaphore(max_concurrent_downloads)
+        # The Whisper model is shared, so transcriptions run one at a time
+        transcribe_lock = asyncio.Lock()
+        
+        async def process_one(url: str) -> Any:
+            transcript = None
+            async with download_slots:
+                audio_path = await asyncio.to_thread(self.download_youtube_video, url, settings.VIDEOS_DIR)
+            if audio_path:
+                async with transcribe_lock:
+                    transcript = await asyncio.to_thread(self.transcribe_video, audio_path)
+            if on_transcript is not None:
+                return await on_transcript(url, audio_path, transcript)
+            return audio_path, transcript
+        
+        return list(await asyncio.gather(*(process_one(url) for url in urls)))
+    
+    def load_cached_transcript(self, transcript_path: str, video_url: str) -> Optional[Dict]:
+        """Return a previously saved transcript if it was made from the same video"""
+        if not os.path.exists(transcript_path):
+            return None
+        try:
+            transcript = load_msgpack(transcript_path)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cached transcript {transcript_path}: {e}")
+            return None
+        if transcript.get('video_url') != video_url:
+            return None
+        return transcript
+    
+    def _migrate_legacy_transcript(self, legacy_path: str, transcript_path: str, video_url: str) -> Optional[Dict]:
+        """Load a transcript saved as JSON by older runs and re-save it in the current cache format"""
+        if not os.path.exists(legacy_path):
+            return None
+        try:
+            with open(legacy_path, 'r') as f:
+                transcript = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable legacy transcript {legacy_path}: {e}")
+            return None
+        # Legacy files were written without their source URL; this path only ever held video_url
+        if transcript.get('video_url', video_url) != video_url:
+            return None
+        transcript['video_url'] = video_url
+        save_msgpack(transcript, transcript_path)
+        return transcript
+    
     def process_recruter_video(self) -> Optional[Dict]:
         """Process the specific Recruter.ai video"""
         video_url = "https://youtu.be/IK62Rk47aas"
+        transcript_path = os.path.join(settings.TRANSCRIPTS_DIR, "recruter_tutorial.msgpack")
+        legacy_transcript_path = os.path.join(settings.TRANSCRIPTS_DIR, "recruter_tutorial.json")
+        
+        # Reuse the saved transcript from a previous run
+        transcript = self.load_cached_transcript(transcript_path, video_url)
+        if not transcript:
+            transcript = self._migrate_legacy_transcript(legacy_transcript_path, transcript_path, video_url)
+        if transcript:
+            self.logger.info("Using cached transcript")
+            return transcript
         
         # Download video
         audio_path = self.download_youtube_video(video_url, settings.VIDEOS_DIR)
         if not audio_path:
             return None
             
-        # Transcribe
+        # Transcribe, then free the model for the test generation phase
         transcript = self.transcribe_video(audio_path)
+        self.close()
         if not transcript:
             return None
             
-        # Save transcript
-        transcript_path = os.path.join(settings.TRANSCRIPTS_DIR, "recruter_tutorial.json")
-        with open(transcript_path, 'w') as f:
-            import json
-            json.dump(transcript, f, indent=2)
+        # Save transcript along with its source so later runs can reuse it
+        transcript['video_url'] = video_url
+        save_msgpack(transcript, transcript_path)
             
         return transcript
\ No newline at end of file
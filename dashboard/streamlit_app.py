@@ -1,18 +1,19 @@
 import streamlit as st
-import json
 import os
+import re
 import sys
+import threading
+import orjson
 from pathlib import Path
 from datetime import datetime
-import time
 import pandas as pd
-from typing import Dict, Any, List
-current_dir = Path(__file__).parent
-parent_dir = current_dir.parent
-sys.path.insert(0, str(parent_dir))
+from typing import Dict, Any, List, Final, Tuple
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
 
 # Import your pipeline
 from main import QAAgentPipeline
+from config.settings import settings
 
 # Page config
 st.set_page_config(
@@ -23,29 +24,8 @@ st.set_page_config(
 )
 
 # Custom CSS for beautiful styling
-st.markdown("""
+CUSTOM_CSS = """
 <style>
-    .main-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        text-align: center;
-        color: white;
-    }
-    
-    .main-header h1 {
-        font-size: 3rem;
-        margin: 0;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-    }
-    
-    .main-header p {
-        font-size: 1.2rem;
-        margin-top: 0.5rem;
-        opacity: 0.9;
-    }
-    
     .feature-card {
         background: white;
         padding: 1.5rem;
@@ -55,22 +35,6 @@ st.markdown("""
         border-left: 4px solid #667eea;
     }
     
-    .success-box {
-        background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 1rem 0;
-    }
-    
-    .error-box {
-        background: linear-gradient(135deg, #f44336 0%, #d32f2f 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 1rem 0;
-    }
-    
     .info-box {
         background: linear-gradient(135deg, #2196F3 0%, #1976D2 100%);
         color: white;
@@ -102,37 +66,67 @@ st.markdown("""
     }
             
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# st.html skips the markdown pipeline; the styles must still be emitted on
+# every run, since Streamlit drops elements that a rerun does not re-create
+st.html(CUSTOM_CSS)
+
+# Playwright output locations, taken from the pipeline's settings so they always match
+GENERATED_DIR = settings.RECRUTER_TESTS_DIR
+REPORTS_DIR = settings.REPORTS_DIR / "recruter_ai"
+
+# Test type folders under GENERATED_DIR and their display names
+TEST_FOLDERS: Final[Dict[str, str]] = {
+    "accessibility": "♿ Accessibility Tests",
+    "cross_browser": "🌐 Cross Browser Tests",
+    "performance": "⚡ Performance Tests",
+    "functional": "🔧 Functionality Tests",
+    "edge_case": "🎯 Edge Cases Tests"
+}
+
+# Report files offered for download, with their descriptions
+REPORT_FILES: Final[Tuple[Tuple[str, str], ...]] = (
+    ("execution_report.html", "HTML Report"),
+    ("execution_report.json", "JSON Data"),
+    ("execution_report.md", "Markdown Report")
+)
+
+# Extensions of generated test files (.spec.js and .test.ts end in these too)
+TEST_FILE_EXTS = frozenset({'.js', '.ts'})
+
+# Splits a markdown report into its "## " sections
+REPORT_SECTION_RE = re.compile(r'(?m)^## ')
 
 # Initialize session state
-if 'pipeline' not in st.session_state:
-    st.session_state.pipeline = None
-if 'processing' not in st.session_state:
-    st.session_state.processing = False
 if 'results' not in st.session_state:
     st.session_state.results = None
 if 'processing_mode' not in st.session_state:
     st.session_state.processing_mode = None
 
+@st.cache_resource(show_spinner="Initializing QAgenie...")
+def get_pipeline() -> QAAgentPipeline:
+    """Create the QA Agent Pipeline once and share it across sessions"""
+    return QAAgentPipeline()
+
+@st.cache_resource
+def get_pipeline_lock() -> threading.Lock:
+    """Lock serializing runs on the shared pipeline, whose agents and caches are not thread-safe"""
+    return threading.Lock()
+
 def init_pipeline():
     """Initialize the QA Agent Pipeline"""
-    if st.session_state.pipeline is None:
-        try:
-            st.session_state.pipeline = QAAgentPipeline()
-            return True
-        except Exception as e:
-            st.error(f"Failed to initialize pipeline: {str(e)}")
-            return False
-    return True
+    try:
+        get_pipeline()
+        return True
+    except Exception as e:
+        st.error(f"Failed to initialize pipeline: {str(e)}")
+        return False
 
 def display_header():
     """Display the main header"""
-    st.markdown("""
-    <div class="main-header">
-        <h1>🧪 QAgenie</h1>
-        <p>AI-Powered Multi-Tool QA Agent for End-to-End Frontend Testing</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.title("🧪 QAgenie")
+    st.caption("AI-Powered Multi-Tool QA Agent for End-to-End Frontend Testing")
 
 def display_sidebar():
     """Display sidebar with options and info"""
@@ -192,23 +186,13 @@ def display_sidebar():
             'test_type': test_type
         }
 
-def display_progress(message: str, progress: float = None):
-    """Display simple progress bar"""
-    st.markdown(f"🔄 {message}")
-    if progress is not None:
-        st.progress(progress)
-
 def display_results(results: Dict[str, Any]):
     """Display processing results"""
     if not results:
         return
     
     if results.get('success'):
-        st.markdown("""
-        <div class="success-box">
-            <h3>✅ Processing Completed Successfully!</h3>
-        </div>
-        """, unsafe_allow_html=True)
+        st.success("✅ Processing Completed Successfully!")
         
         # Display detailed results
         display_detailed_results(results)
@@ -217,13 +201,10 @@ def display_results(results: Dict[str, Any]):
         display_next_steps(results)
         
     else:
-        st.markdown(f"""
-        <div class="error-box">
-            <h3>❌ Processing Failed</h3>
-            <p><strong>Error:</strong> {results.get('message', 'Unknown error')}</p>
-            <p><strong>Details:</strong> {results.get('error', 'No details available')}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.error(
+            f"❌ Processing Failed: {results.get('message', 'Unknown error')}\n\n"
+            f"Details: {results.get('error', 'No details available')}"
+        )
 
 def display_detailed_results(results: Dict[str, Any]):
     """Display detailed results"""
@@ -233,7 +214,8 @@ def display_detailed_results(results: Dict[str, Any]):
     
     # Check if this is a complete pipeline with execution
     if 'execution_result' in data:
-        # Full pipeline - show all tabs including reports
+        # Full pipeline - show all tabs including reports.
+        # Each tab is a fragment, so clicks inside it rerun only that tab.
         tab1, tab2 = st.tabs([ "📁 Files", "🔍 Reports"])
         
         with tab1:
@@ -263,19 +245,38 @@ def display_scripts_tab(data: Dict[str, Any]):
             status = "✅" if detail.get('success') else "❌"
             st.markdown(f"{status} {detail.get('name', 'Unknown')}")
 
+@st.cache_data(show_spinner=False)
+def _read_text(path: str, mtime: float) -> str:
+    """Read a text file; mtime only keys the cache so edited files are re-read"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+@st.cache_data(show_spinner=False)
+def _read_bytes(path: str, mtime: float) -> bytes:
+    """Read a binary file; mtime only keys the cache so edited files are re-read"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _scan_generated(base_path: str) -> Dict[str, List[str]]:
+    """Map each folder under base_path to its sorted list of test files"""
+    scanned = {}
+    with os.scandir(base_path) as folders:
+        for folder in folders:
+            if not folder.is_dir():
+                continue
+            with os.scandir(folder.path) as entries:
+                scanned[folder.name] = sorted(
+                    entry.name for entry in entries
+                    if entry.is_file() and os.path.splitext(entry.name)[1] in TEST_FILE_EXTS
+                )
+    return scanned
+
+@st.fragment
 def display_files_tab(data: Dict[str, Any]):
     """Display generated files information with enhanced folder structure"""
     # Define the base path for generated files
-    base_path = r"C:\Users\Jaidivya Kumar Lohan\Desktop\QAAgent_Task_Jaidivya_Kumar_Lohani\playwright_tests\tests\generated\recruter_ai"
-    
-    # Define the test type folders
-    test_folders = {
-        "accessibility": "♿ Accessibility Tests",
-        "cross_browser": "🌐 Cross Browser Tests", 
-        "performance": "⚡ Performance Tests",
-        "functional": "🔧 Functionality Tests",
-        "edge_case": "🎯 Edge Cases Tests"
-    }
+    base_path = str(GENERATED_DIR)
     
     st.markdown("### 📁 Generated Test Files")
     
@@ -284,49 +285,45 @@ def display_files_tab(data: Dict[str, Any]):
         st.warning(f"Generated files directory not found: {base_path}")
         return
     
-    total_files = 0
+    scanned = _scan_generated(base_path)
+    total_files = sum(len(scanned.get(folder_name, [])) for folder_name in TEST_FOLDERS)
+    
+    # Render one folder at a time instead of an expander per folder
+    folder_name = st.selectbox(
+        "Test folder",
+        list(TEST_FOLDERS),
+        format_func=lambda name: f"{TEST_FOLDERS[name]} ({len(scanned.get(name, []))} files)"
+    )
+    display_name = TEST_FOLDERS[folder_name]
+    folder_path = os.path.join(base_path, folder_name)
     
-    # Display files by category
-    for folder_name, display_name in test_folders.items():
-        folder_path = os.path.join(base_path, folder_name)
+    if folder_name not in scanned:
+        st.warning(f"Folder not found: {display_name}")
+    elif not scanned[folder_name]:
+        st.info(f"No test files found in {display_name}")
+    else:
+        test_files = scanned[folder_name]
+        files_df = pd.DataFrame({
+            'file': test_files,
+            'path': [os.path.join(folder_path, file) for file in test_files]
+        })
+        event = st.dataframe(
+            files_df,
+            use_container_width=True,
+            hide_index=True,
+            on_select='rerun',
+            selection_mode='single-row',
+            key=f"files_{folder_name}"
+        )
         
-        if os.path.exists(folder_path):
-            # Get all test files in this folder
-            test_files = []
-            for file in os.listdir(folder_path):
-                if file.endswith(('.js', '.ts', '.spec.js', '.spec.ts', '.test.js', '.test.ts')):
-                    test_files.append(file)
-            
-            if test_files:
-                total_files += len(test_files)
-                
-                with st.expander(f"{display_name} ({len(test_files)} files)"):
-                    for file in sorted(test_files):
-                        file_path = os.path.join(folder_path, file)
-                        
-                        # Display file info
-                        col1, col2 = st.columns([3, 1])
-                        
-                        with col1:
-                            st.markdown(f"📄 **{file}**")
-                            st.caption(f"Path: {file_path}")
-                        
-                        with col2:
-                            # Add a button to view file content
-                            if st.button(f"👁️ View", key=f"view_{folder_name}_{file}"):
-                                try:
-                                    with open(file_path, 'r', encoding='utf-8') as f:
-                                        content = f.read()
-                                    
-                                    # Show file content in a modal-like expander
-                                    with st.expander(f"📖 Content: {file}", expanded=True):
-                                        st.code(content, language='javascript')
-                                except Exception as e:
-                                    st.error(f"Error reading file: {e}")
-            else:
-                st.info(f"No test files found in {display_name}")
-        else:
-            st.warning(f"Folder not found: {display_name}")
+        # Show the content of the selected file
+        if event.selection.rows:
+            file_path = files_df['path'].iloc[event.selection.rows[0]]
+            try:
+                with st.expander(f"📖 Content: {os.path.basename(file_path)}", expanded=True):
+                    st.code(_read_text(file_path, os.path.getmtime(file_path)), language='javascript')
+            except Exception as e:
+                st.error(f"Error reading file: {e}")
     
     # Display summary
     if total_files > 0:
@@ -344,18 +341,17 @@ def display_files_tab(data: Dict[str, Any]):
         with col1:
             if st.button("📦 View All Files List"):
                 st.markdown("#### Complete Files List:")
-                for folder_name, display_name in test_folders.items():
-                    folder_path = os.path.join(base_path, folder_name)
-                    if os.path.exists(folder_path):
-                        test_files = [f for f in os.listdir(folder_path) 
-                                    if f.endswith(('.js', '.ts', '.spec.js', '.spec.ts', '.test.js', '.test.ts'))]
-                        if test_files:
-                            st.markdown(f"**{display_name}:**")
-                            for file in sorted(test_files):
-                                st.markdown(f"  • {file}")
+                all_files_df = pd.DataFrame(
+                    [
+                        {'Folder': display_name, 'File': file}
+                        for folder_name, display_name in TEST_FOLDERS.items()
+                        for file in scanned.get(folder_name, [])
+                    ]
+                )
+                st.dataframe(all_files_df, use_container_width=True, hide_index=True)
         
         with col2:
-            st.info("💡 Tip: Use the 'View' buttons above to inspect individual test files before running them.")
+            st.info("💡 Tip: Select a row in the table above to inspect a test file before running it.")
 
 def display_breakdown_tab(data: Dict[str, Any]):
     """Display test breakdown charts"""
@@ -410,47 +406,24 @@ def display_next_steps(results: Dict[str, Any]):
         return
     
     st.markdown("## 📋 Next Steps")
-    
-    for step in next_steps:
-        if step.strip():  # Skip empty lines
-            st.markdown(f"• {step}")
+    st.info("\n\n".join(f"• {step}" for step in next_steps if step.strip()))
 
 def process_recruiter_ai(pipeline_mode: str):
     """Process Recruiter.ai video"""
+    progress_bar = st.progress(0.0)
+    status = st.empty()
+    
+    def on_progress(message: str, progress: float):
+        progress_bar.progress(progress)
+        status.markdown(f"🔄 {message}")
+    
     if pipeline_mode == 'full':
-        # Full pipeline
-        display_progress("Starting full pipeline: video → test cases → scripts → execution", 0.1)
-        time.sleep(3)
-        
-        display_progress("Downloading and transcribing video...", 0.2)
-        time.sleep(10)
-        
-        display_progress("Processing transcript into structured format...", 0.4)
-        time.sleep(10)
-        
-        display_progress("Generating test cases...", 0.6)
-        time.sleep(15)
-        
-        display_progress("Converting to Playwright scripts...", 0.8)
-        time.sleep(15)
-        
-        display_progress("Executing tests...", 0.9)
-        time.sleep(15)
-        
-        return st.session_state.pipeline.process_recruter_video_complete()
+        # Full pipeline: video → test cases → scripts → execution
+        return get_pipeline().process_recruter_video_complete(progress_callback=on_progress)
     
     else:
         # Generate only
-        display_progress("Downloading and transcribing video...", 0.3)
-        time.sleep(1)
-        
-        display_progress("Processing transcript...", 0.6)
-        time.sleep(4)
-        
-        display_progress("Generating test cases...", 0.9)
-        time.sleep(8)
-        
-        result = st.session_state.pipeline.process_recruter_video()
+        result = get_pipeline().process_recruter_video(progress_callback=on_progress)
         
         # Convert AgentResponse to dict
         if hasattr(result, 'success'):
@@ -471,19 +444,8 @@ def process_custom_video(video_url: str):
             'error': 'Missing video URL'
         }
     
-    display_progress(f"Processing custom video: {video_url}", 0.2)
-    time.sleep(3)
-    
-    display_progress("Downloading video...", 0.4)
-    time.sleep(3)
-    
-    display_progress("Transcribing video...", 0.6)
-    time.sleep(5)
-    
-    display_progress("Generating test cases...", 0.8)
-    time.sleep(10)
-    
-    result = st.session_state.pipeline.run_custom_video(video_url)
+    with st.spinner(f"Downloading, transcribing and generating test cases for {video_url}..."):
+        result = get_pipeline().run_custom_video(video_url)
     
     # Convert AgentResponse to dict if needed
     if hasattr(result, 'success'):
@@ -495,16 +457,26 @@ def process_custom_video(video_url: str):
         }
     return result
 
-def load_execution_reports(reports_dir: str) -> Dict[str, Any]:
-    """Load execution reports from the reports directory"""
+def _file_mtime(path: str) -> float:
+    """Return the file's modification time, or 0.0 if it does not exist"""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
+@st.cache_data(show_spinner=False)
+def load_execution_reports(reports_dir: str, json_mtime: float, md_mtime: float, html_mtime: float) -> Dict[str, Any]:
+    """Load execution reports from the reports directory
+    
+    The mtimes are unused in the body; they key the cache so rewritten reports are reloaded.
+    """
     reports = {}
     
     try:
         # Load JSON report for data processing
         json_path = os.path.join(reports_dir, "execution_report.json")
         if os.path.exists(json_path):
-            with open(json_path, 'r') as f:
-                reports['json'] = json.load(f)
+            reports['json'] = orjson.loads(Path(json_path).read_bytes())
         
         # Load MD report for readable content
         md_path = os.path.join(reports_dir, "execution_report.md")
@@ -522,9 +494,10 @@ def load_execution_reports(reports_dir: str) -> Dict[str, Any]:
     
     return reports
 
+@st.fragment
 def display_execution_reports(data: Dict[str, Any]):
     """Display execution reports after test completion"""
-    reports_dir = "C:/Users/Jaidivya Kumar Lohan/Desktop/QAAgent_Task_Jaidivya_Kumar_Lohani/playwright_tests/tests/reports/recruter_ai"
+    reports_dir = str(REPORTS_DIR)
     
     if not os.path.exists(reports_dir):
         st.info("No execution reports found. Run tests to generate reports.")
@@ -532,7 +505,13 @@ def display_execution_reports(data: Dict[str, Any]):
     
     st.markdown("## 📊 Test Execution Reports")
     
-    reports = load_execution_reports(reports_dir)
+    json_mtime = _file_mtime(os.path.join(reports_dir, "execution_report.json"))
+    reports = load_execution_reports(
+        reports_dir,
+        json_mtime,
+        _file_mtime(os.path.join(reports_dir, "execution_report.md")),
+        _file_mtime(os.path.join(reports_dir, "execution_report.html"))
+    )
     
     if not reports:
         st.warning("No valid reports found in the reports directory.")
@@ -542,7 +521,7 @@ def display_execution_reports(data: Dict[str, Any]):
     tab1, tab2, tab3 = st.tabs(["📈 Summary", "📋 Detailed Report", "📁 Files"])
     
     with tab1:
-        display_execution_summary(reports)
+        display_execution_summary(reports, json_mtime)
     
     with tab2:
         display_detailed_report(reports)
@@ -550,64 +529,73 @@ def display_execution_reports(data: Dict[str, Any]):
     with tab3:
         display_report_files(reports_dir)
 
-def display_execution_summary(reports: Dict[str, Any]):
+@st.cache_data(show_spinner=False)
+def _results_df(json_mtime: float, _records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Build the test results table; keyed on the report's mtime, the records are not hashed"""
+    return pd.DataFrame(_records)
+
+def display_execution_summary(reports: Dict[str, Any], json_mtime: float):
     """Display execution summary from JSON report"""
     if 'json' not in reports:
         st.info("No JSON report available for summary.")
         return
     
     json_data = reports['json']
+    total_tests = json_data.get('total_tests', 0)
+    passed = json_data.get('passed', 0)
+    success_rate = (passed / total_tests) * 100 if total_tests else 0.0
     
     # Display metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Tests", json_data.get('total_tests', 0))
+        st.metric("Total Tests", total_tests)
     
     with col2:
-        st.metric("Passed", json_data.get('passed', 0), 
+        st.metric("Passed", passed, 
                  delta=None, delta_color="normal")
     
     with col3:
         st.metric("Failed", json_data.get('failed', 0))
     
     with col4:
-        success_rate = (json_data.get('passed', 0) / max(json_data.get('total_tests', 1), 1)) * 100
         st.metric("Success Rate", f"{success_rate:.1f}%")
     
     # Display test results table if available
     if 'test_results' in json_data:
         st.markdown("### Test Results")
-        df = pd.DataFrame(json_data['test_results'])
+        df = _results_df(json_mtime, json_data['test_results'])
         st.dataframe(df, use_container_width=True)
 
 def display_detailed_report(reports: Dict[str, Any]):
     """Display detailed markdown report"""
     if 'markdown' in reports:
         st.markdown("### Detailed Execution Report")
-        st.markdown(reports['markdown'])
+        
+        # One expander per "## " section; only the first starts expanded
+        preamble, *sections = REPORT_SECTION_RE.split(reports['markdown'])
+        if preamble.strip():
+            st.markdown(preamble)
+        for i, section in enumerate(sections):
+            title, _, body = section.partition('\n')
+            with st.expander(title.strip() or 'Report', expanded=(i == 0)):
+                st.markdown(body)
     
     # Option to download HTML report
     if 'html_path' in reports:
-        with open(reports['html_path'], 'rb') as f:
-            st.download_button(
-                label="📥 Download HTML Report",
-                data=f.read(),
-                file_name="execution_report.html",
-                mime="text/html"
-            )
+        html_path = reports['html_path']
+        st.download_button(
+            label="📥 Download HTML Report",
+            data=_read_bytes(html_path, os.path.getmtime(html_path)),
+            file_name="execution_report.html",
+            mime="text/html"
+        )
 
 def display_report_files(reports_dir: str):
     """Display available report files"""
     st.markdown("### Available Report Files")
     
-    report_files = [
-        ("execution_report.html", "HTML Report"),
-        ("execution_report.json", "JSON Data"),
-        ("execution_report.md", "Markdown Report")
-    ]
-    
-    for filename, description in report_files:
+    for filename, description in REPORT_FILES:
         filepath = os.path.join(reports_dir, filename)
         if os.path.exists(filepath):
             col1, col2 = st.columns([3, 1])
@@ -615,14 +603,13 @@ def display_report_files(reports_dir: str):
                 st.markdown(f"**{description}**")
                 st.code(filepath, language='text')
             with col2:
-                if st.button(f"📥 Download", key=f"download_{filename}"):
-                    with open(filepath, 'rb') as f:
-                        st.download_button(
-                            label=f"Download {filename}",
-                            data=f.read(),
-                            file_name=filename,
-                            mime="text/html" if filename.endswith('.html') else "text/plain"
-                        )
+                st.download_button(
+                    label=f"📥 {description}",
+                    data=_read_bytes(filepath, os.path.getmtime(filepath)),
+                    file_name=filename,
+                    mime="text/html" if filename.endswith('.html') else "text/plain",
+                    key=f"download_{filename}"
+                )
 
 def process_scripts_only(test_cases_path: str, test_type: str):
     """Process scripts generation only"""
@@ -633,19 +620,11 @@ def process_scripts_only(test_cases_path: str, test_type: str):
             'error': 'Missing test cases path'
         }
     
-    display_progress(f"Loading test cases from: {test_cases_path}", 0.2)
-    time.sleep(1)
-    
-    display_progress("Converting test cases to Playwright scripts...", 0.6)
-    time.sleep(1)
-    
-    display_progress("Saving generated scripts...", 0.8)
-    time.sleep(1)
-    
-    return st.session_state.pipeline.generate_scripts_from_existing_tests(
-        test_cases_path, 
-        test_type=test_type
-    )
+    with st.spinner(f"Converting test cases from {test_cases_path} to Playwright scripts..."):
+        return get_pipeline().generate_scripts_from_existing_tests(
+            test_cases_path, 
+            test_type=test_type
+        )
 
 def main():
     """Main Streamlit application"""
@@ -680,35 +659,41 @@ def main():
     
     with col2:
         # Process button
-        if st.button("🚀 Start Processing", key="process_btn"):
-            if not st.session_state.processing:
-                st.session_state.processing = True
-                st.session_state.processing_mode = config['type']
-                st.session_state.results = None
-                st.rerun()
-    
-    # Processing logic
-    if st.session_state.processing:
-        try:
-            if config['type'] == 'recruiter_ai':
-                result = process_recruiter_ai(config['pipeline_mode'])
-            elif config['type'] == 'custom_video':
-                result = process_custom_video(config['video_url'])
-            else:
-                result = process_scripts_only(config['test_cases_path'], config['test_type'])
-            
-            st.session_state.results = result
-            st.session_state.processing = False
-            st.rerun()
+        start_clicked = st.button("🚀 Start Processing", key="process_btn")
+    
+    # Processing logic runs in the same script run as the click
+    if start_clicked:
+        st.session_state.processing_mode = config['type']
+        st.session_state.results = None
+        
+        with st.status("Processing...", expanded=True) as status:
+            try:
+                # One run at a time across all sessions sharing the pipeline
+                with get_pipeline_lock():
+                    if config['type'] == 'recruiter_ai':
+                        result = process_recruiter_ai(config['pipeline_mode'])
+                    elif config['type'] == 'custom_video':
+                        result = process_custom_video(config['video_url'])
+                    else:
+                        result = process_scripts_only(config['test_cases_path'], config['test_type'])
+                
+            except Exception as e:
+                result = {
+                    'success': False,
+                    'message': f'Processing failed: {str(e)}',
+                    'error': str(e)
+                }
             
-        except Exception as e:
-            st.session_state.results = {
-                'success': False,
-                'message': f'Processing failed: {str(e)}',
-                'error': str(e)
-            }
-            st.session_state.processing = False
-            st.rerun()
+            succeeded = bool(result and result.get('success'))
+            status.update(
+                label="Processing complete" if succeeded else "Processing failed",
+                state="complete" if succeeded else "error",
+                expanded=False
+            )
+        
+        st.session_state.results = result
+        # The run may have regenerated the test files, so drop the cached listing
+        _scan_generated.clear()
     
     # Display results
     if st.session_state.results:
@@ -1,19 +1,30 @@
 import os
+import sys
+import asyncio
 import logging
 import json
+import orjson
+import hashlib
 from pathlib import Path
 from typing import Dict, Any, List
 from datetime import datetime
 import webbrowser
 import subprocess
 import glob
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from typing import Iterator, Optional, Callable, TYPE_CHECKING
+from functools import cached_property
 # Import your existing components
-from core.video_processor import VideoProcessor
-from agents.test_generator_agent import TestGeneratorAgent
+from core.pipeline_hot import SEGMENTS_ADAPTER, build_processed_video, extract_action_description
 from agents.test_execution_agent import TestExecutionAgent
 from models.test_case import ProcessedVideo, VideoSegment, AgentResponse
 from config.settings import settings
+from utils.file_utils import dumps_json
+
+if TYPE_CHECKING:
+    from core.video_processor import VideoProcessor
+    from agents.test_generator_agent import TestGeneratorAgent
 
 # Configure logging
 logging.basicConfig(
@@ -22,31 +33,67 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+RECRUTER_VIDEO_URL = "https://youtu.be/IK62Rk47aas"
+
+# Columnar (parquet) copy of the processed Recruter.ai video
+PROCESSED_VIDEO_PATH = settings.TRANSCRIPTS_DIR / "processed_recruter_video.parquet"
+PROCESSED_VIDEO_METADATA_KEY = b'processed_video'
+
 class QAAgentPipeline:
     """Main pipeline that orchestrates video processing and test case generation"""
     
+    # Directories only need creating once per process
+    _dirs_initialized: bool = False
+    
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
-        self.video_processor = VideoProcessor()
-        self.test_generator_agent = TestGeneratorAgent(config)
         self.execution_agent = TestExecutionAgent()
         
+        # In-process results keyed by video URL, so both Recruter.ai pipelines
+        # transcribe and structure the video at most once per pipeline
+        self._transcript_cache: Dict[str, Dict] = {}
+        self._processed_cache: Dict[str, ProcessedVideo] = {}
+        
         # Setup directories using the updated settings
         self.setup_directories()
         
+        # Recruter.ai output locations as strings; setup_directories has created them, so
+        # read the paths directly rather than through getters that re-run ensure_directories
+        self._recruter_dirs = {
+            'tests_dir': str(settings.RECRUTER_TESTS_DIR),
+            'reports_dir': str(settings.REPORTS_DIR / 'recruter_ai'),
+            'screenshots_dir': str(settings.SCREENSHOTS_DIR),
+            'videos_dir': str(settings.VIDEOS_TEST_DIR)
+        }
+        
         logger.info("QA Agent Pipeline initialized")
     
+    @cached_property
+    def video_processor(self) -> 'VideoProcessor':
+        """Video processor, created on first use so whisper/torch are only imported when needed"""
+        from core.video_processor import VideoProcessor
+        return VideoProcessor(quiet=self.config.get('quiet', False))
+    
+    @cached_property
+    def test_generator_agent(self) -> 'TestGeneratorAgent':
+        """Test generator agent, created on first use so the RAG stack is only imported when needed"""
+        from agents.test_generator_agent import TestGeneratorAgent
+        return TestGeneratorAgent(self.config)
+    
     def setup_directories(self):
         """Create necessary directories using settings"""
+        if QAAgentPipeline._dirs_initialized:
+            return
+        
         try:
             settings.ensure_directories()
             
-            # Ensure vectorstore directory exists (fix for FAISS error)
+            # Vectorstore directory must exist (fix for FAISS error)
             vectorstore_dir = Path(settings.DATA_DIR) / 'vectorstore'
-            vectorstore_dir.mkdir(parents=True, exist_ok=True)
             
             # Ensure all other critical directories exist
             critical_dirs = [
+                vectorstore_dir,
                 settings.VIDEOS_DIR,
                 settings.TRANSCRIPTS_DIR,
                 settings.SCREENSHOTS_DIR,
@@ -57,29 +104,37 @@ class QAAgentPipeline:
                 settings.get_reports_dir('custom')
             ]
             
-            for dir_path in critical_dirs:
-                Path(dir_path).mkdir(parents=True, exist_ok=True)
+            # Create whatever is missing concurrently; each mkdir is a round trip on slow filesystems
+            missing_dirs = [dir_path for dir_path in critical_dirs if not os.path.isdir(dir_path)]
+            if missing_dirs:
+                with ThreadPoolExecutor(max_workers=min(4, len(missing_dirs))) as executor:
+                    list(executor.map(lambda dir_path: os.makedirs(dir_path, exist_ok=True), missing_dirs))
             
+            QAAgentPipeline._dirs_initialized = True
             logger.info("All directories created successfully")
             
         except Exception as e:
             logger.error(f"Error setting up directories: {e}")
             raise
     
-    def process_recruter_video(self) -> AgentResponse:
+    def process_recruter_video(self, progress_callback: Optional[Callable[[str, float], None]] = None) -> AgentResponse:
         """
         Complete pipeline for processing Recruter.ai video:
         1. Download video
         2. Transcribe
         3. Process transcript into segments
         4. Generate test cases
+        
+        progress_callback, if given, is called with (message, fraction) as each step starts.
         """
+        report_progress = progress_callback or (lambda message, progress: None)
         try:
             logger.info("Starting Recruter.ai video processing pipeline")
             
             # Step 1: Download and transcribe video
             logger.info("Step 1: Downloading and transcribing video...")
-            transcript_data = self.video_processor.process_recruter_video()
+            report_progress("Downloading and transcribing video...", 0.1)
+            transcript_data = self._cached_recruter_transcript()
             
             if not transcript_data:
                 return AgentResponse(
@@ -90,23 +145,27 @@ class QAAgentPipeline:
             
             # Step 2: Process transcript into structured format
             logger.info("Step 2: Processing transcript into structured format...")
-            processed_video = self.create_processed_video(transcript_data)
+            report_progress("Processing transcript...", 0.4)
+            processed_video = self._cached_recruter_processed_video(transcript_data)
             
             # Step 3: Generate test cases using the agent
             logger.info("Step 3: Generating test cases...")
+            report_progress("Generating test cases...", 0.6)
             test_generation_input = {
                 'processed_video': processed_video,
-                'requirements': self.get_default_requirements()
+                'requirements': self.default_requirements
             }
             
             agent_response = self.test_generator_agent.process(test_generation_input)
             
+            report_progress("Test case generation finished", 1.0)
+            
             if agent_response.success:
                 logger.info(f"Pipeline completed successfully! {agent_response.message}")
                 
                 # Add pipeline metadata
                 agent_response.data['pipeline_info'] = {
-                    'video_url': "https://youtu.be/IK62Rk47aas",
+                    'video_url': RECRUTER_VIDEO_URL,
                     'processing_time': datetime.now().isoformat(),
                     'transcript_segments': len(transcript_data.get('segments', [])),
                     'video_duration': processed_video.duration
@@ -124,70 +183,31 @@ class QAAgentPipeline:
                 error=str(e)
             )
     
+    def _cached_recruter_transcript(self) -> Optional[Dict]:
+        """Transcript of the Recruter.ai video, fetched from the video processor once per pipeline"""
+        transcript_data = self._transcript_cache.get(RECRUTER_VIDEO_URL)
+        if transcript_data is None:
+            transcript_data = self.video_processor.process_recruter_video()
+            if transcript_data:
+                self._transcript_cache[RECRUTER_VIDEO_URL] = transcript_data
+        return transcript_data
+    
+    def _cached_recruter_processed_video(self, transcript_data: Dict[str, Any]) -> ProcessedVideo:
+        """ProcessedVideo for the Recruter.ai transcript, built once per pipeline"""
+        processed_video = self._processed_cache.get(RECRUTER_VIDEO_URL)
+        if processed_video is None:
+            processed_video = self.create_processed_video(transcript_data)
+            self._processed_cache[RECRUTER_VIDEO_URL] = processed_video
+        return processed_video
+    
     def create_processed_video(self, transcript_data: Dict[str, Any]) -> ProcessedVideo:
         """Convert raw transcript data into ProcessedVideo model"""
         try:
-            # Extract video info
-            video_url = "https://youtu.be/IK62Rk47aas"
-            video_title = "Recruter.ai How-to Tutorial"
-            
-            # Get duration from segments
-            segments = transcript_data.get('segments', [])
-            duration = segments[-1]['end'] if segments else 0
-            
-            # Create video segments
-            video_segments = []
-            ui_components = set()
-            extracted_flows = []
-            
-            for segment in segments:
-                # Extract UI elements and flows from transcript
-                transcript_text = segment['text'].lower()
-                
-                # Common UI elements to look for
-                ui_keywords = [
-                    'button', 'click', 'input', 'field', 'form', 'dropdown', 
-                    'menu', 'link', 'tab', 'page', 'screen', 'dialog', 
-                    'popup', 'notification', 'login', 'signup', 'dashboard',
-                    'profile', 'settings', 'search', 'upload', 'download'
-                ]
-                
-                found_ui_elements = []
-                for keyword in ui_keywords:
-                    if keyword in transcript_text:
-                        found_ui_elements.append(keyword)
-                        ui_components.add(keyword)
-                
-                # Extract potential user flows
-                flow_keywords = [
-                    'sign up', 'log in', 'create account', 'fill form',
-                    'submit', 'upload', 'download', 'navigate', 'search',
-                    'filter', 'sort', 'select', 'choose', 'configure'
-                ]
-                
-                for flow in flow_keywords:
-                    if flow in transcript_text:
-                        extracted_flows.append(f"User can {flow}")
-                
-                # Create video segment
-                video_segment = VideoSegment(
-                    start_time=segment['start'],
-                    end_time=segment['end'],
-                    transcript=segment['text'],
-                    action_description=self.extract_action_description(segment['text']),
-                    ui_elements=found_ui_elements
-                )
-                video_segments.append(video_segment)
-            
-            # Create ProcessedVideo
-            processed_video = ProcessedVideo(
-                url=video_url,
-                title=video_title,
-                duration=duration,
-                full_transcript=transcript_data.get('text', ''),
-                segments=video_segments,
-                extracted_flows=list(set(extracted_flows)),
-                ui_components=list(ui_components)
+            processed_video = build_processed_video(
+                RECRUTER_VIDEO_URL,
+                "Recruter.ai How-to Tutorial",
+                transcript_data,
+                extract_ui=True
             )
             
             # Save processed video for reference
@@ -201,26 +221,11 @@ class QAAgentPipeline:
     
     def extract_action_description(self, transcript_text: str) -> str:
         """Extract actionable description from transcript text"""
-        # Simple heuristic to identify actions
-        action_verbs = [
-            'click', 'tap', 'select', 'choose', 'enter', 'type', 'fill',
-            'submit', 'upload', 'download', 'navigate', 'go to', 'open',
-            'close', 'save', 'delete', 'edit', 'update', 'create', 'add'
-        ]
-        
-        text_lower = transcript_text.lower()
-        for verb in action_verbs:
-            if verb in text_lower:
-                # Extract sentence containing the action
-                sentences = transcript_text.split('.')
-                for sentence in sentences:
-                    if verb in sentence.lower():
-                        return sentence.strip()
-        
-        return transcript_text[:100] + "..." if len(transcript_text) > 100 else transcript_text
+        return extract_action_description(transcript_text)
     
-    def get_default_requirements(self) -> Dict[str, Any]:
-        """Get default test requirements for Recruter.ai"""
+    @cached_property
+    def default_requirements(self) -> Dict[str, Any]:
+        """Default test requirements for Recruter.ai, built once per pipeline; treat as read-only"""
         return {
             'target_application': 'Recruter.ai',
             'base_url': settings.RECRUTER_BASE_URL,
@@ -250,23 +255,79 @@ class QAAgentPipeline:
                 'Core functionality'
             ],
             'output_directories': {
-                'tests': str(settings.get_test_output_dir('recruter_ai')),
-                'reports': str(settings.get_reports_dir('recruter_ai'))
+                'tests': self._recruter_dirs['tests_dir'],
+                'reports': self._recruter_dirs['reports_dir']
             }
         }
     
     def save_processed_video(self, processed_video: ProcessedVideo):
-        """Save processed video data for reference"""
+        """Save processed video data for reference, with segments stored column by column"""
         try:
-            output_path = settings.TRANSCRIPTS_DIR / "processed_recruter_video.json"
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(processed_video.model_dump(), f, indent=2, ensure_ascii=False)
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            
+            output_path = PROCESSED_VIDEO_PATH
+            hash_path = output_path.with_name(output_path.name + '.sha256')
+            
+            # Skip the write when the saved file already holds this exact content
+            content_hash = hashlib.sha256(processed_video.model_dump_json().encode('utf-8')).hexdigest()
+            if output_path.exists() and hash_path.exists() and hash_path.read_text() == content_hash:
+                logger.info(f"Processed video unchanged, keeping: {output_path}")
+                return
+            
+            segments = processed_video.segments
+            table = pa.table({
+                'start_time': pa.array([segment.start_time for segment in segments], type=pa.float64()),
+                'end_time': pa.array([segment.end_time for segment in segments], type=pa.float64()),
+                'transcript': pa.array([segment.transcript for segment in segments], type=pa.string()),
+                'action_description': pa.array([segment.action_description for segment in segments], type=pa.string()),
+                'ui_elements': pa.array([segment.ui_elements for segment in segments], type=pa.list_(pa.string()))
+            })
+            
+            # Video-level fields travel in the schema metadata so the file is self-contained
+            table = table.replace_schema_metadata({
+                PROCESSED_VIDEO_METADATA_KEY: processed_video.model_dump_json(exclude={'segments'})
+            })
+            
+            # Write next to the target and swap it in, so readers never see a partial file
+            tmp_path = output_path.with_name(output_path.name + '.tmp')
+            pq.write_table(table, tmp_path, compression='zstd')
+            os.replace(tmp_path, output_path)
+            hash_path.write_text(content_hash)
             
             logger.info(f"Processed video saved to: {output_path}")
             
         except Exception as e:
             logger.error(f"Error saving processed video: {e}")
     
+    def load_processed_video(self, path: Path = None) -> Optional[ProcessedVideo]:
+        """Load a processed video written by save_processed_video"""
+        try:
+            import pyarrow.parquet as pq
+            
+            table = pq.read_table(path or PROCESSED_VIDEO_PATH)
+            video_fields = json.loads(table.schema.metadata[PROCESSED_VIDEO_METADATA_KEY])
+            segments = [VideoSegment(**row) for row in table.to_pylist()]
+            return ProcessedVideo(**video_fields, segments=segments)
+            
+        except Exception as e:
+            logger.error(f"Error loading processed video: {e}")
+            return None
+    
+    def iter_processed_segments(self, path: Path = None, batch_size: int = 256) -> Iterator[VideoSegment]:
+        """Yield saved segments one record batch at a time instead of materializing the whole table"""
+        import pyarrow.parquet as pq
+        
+        parquet_file = pq.ParquetFile(path or PROCESSED_VIDEO_PATH)
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            yield from SEGMENTS_ADAPTER.validate_python(batch.to_pylist())
+    
+    def load_processed_segment_columns(self, columns: List[str], path: Path = None) -> Dict[str, List]:
+        """Read only the given segment columns (e.g. ['transcript']) from a saved processed video"""
+        import pyarrow.parquet as pq
+        
+        return pq.read_table(path or PROCESSED_VIDEO_PATH, columns=columns).to_pydict()
+    
     def run_custom_video(self, video_url: str, requirements: Dict[str, Any] = None) -> AgentResponse:
         """Process a custom video URL"""
         try:
@@ -294,23 +355,7 @@ class QAAgentPipeline:
                     error="Video transcription failed"
                 )
             
-            # Process into structured format
-            processed_video = self.create_processed_video_from_url(video_url, transcript_data)
-            
-            # Generate test cases with custom output directory
-            if not requirements:
-                requirements = self.get_default_requirements()
-                requirements['output_directories'] = {
-                    'tests': str(settings.get_test_output_dir('custom')),
-                    'reports': str(settings.get_reports_dir('custom'))
-                }
-            
-            test_generation_input = {
-                'processed_video': processed_video,
-                'requirements': requirements
-            }
-            
-            return self.test_generator_agent.process(test_generation_input)
+            return self._generate_custom_video_tests(video_url, transcript_data, requirements)
             
         except Exception as e:
             logger.error(f"Custom video processing error: {e}")
@@ -320,35 +365,144 @@ class QAAgentPipeline:
                 error=str(e)
             )
     
-    def create_processed_video_from_url(self, url: str, transcript_data: Dict) -> ProcessedVideo:
-        """Create ProcessedVideo from custom URL"""
-        # Similar to create_processed_video but with custom URL
-        segments = transcript_data.get('segments', [])
-        duration = segments[-1]['end'] if segments else 0
+    def _generate_custom_video_tests(self, video_url: str, transcript_data: Dict, requirements: Dict[str, Any] = None) -> AgentResponse:
+        """Structure a custom video transcript and generate its test cases"""
+        # Process into structured format
+        processed_video = self.create_processed_video_from_url(video_url, transcript_data)
         
-        # Extract title from URL or use generic
-        title = f"Custom Video - {url}"
+        test_generation_input = {
+            'mode': 'generate_test_cases',
+            'test_type': 'custom',
+            'processed_video': processed_video,
+            'requirements': self._custom_video_requirements(requirements)
+        }
         
-        video_segments = []
-        for segment in segments:
-            video_segment = VideoSegment(
-                start_time=segment['start'],
-                end_time=segment['end'],
-                transcript=segment['text'],
-                action_description=self.extract_action_description(segment['text']),
-                ui_elements=[]
-            )
-            video_segments.append(video_segment)
+        return self.test_generator_agent.process(test_generation_input)
+    
+    def _custom_video_requirements(self, requirements: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Default requirements with custom output directories, unless requirements are given"""
+        if requirements:
+            return requirements
         
-        return ProcessedVideo(
-            url=url,
-            title=title,
-            duration=duration,
-            full_transcript=transcript_data.get('text', ''),
-            segments=video_segments,
-            extracted_flows=[],
-            ui_components=[]
-        )
+        # Copy so the shared default_requirements keep their Recruter.ai directories
+        return {
+            **self.default_requirements,
+            'output_directories': {
+                'tests': str(settings.get_test_output_dir('custom')),
+                'reports': str(settings.get_reports_dir('custom'))
+            }
+        }
+    
+    def run_custom_videos_batch(self, video_urls: List[str], requirements: Dict[str, Any] = None,
+                                max_concurrent_downloads: int = 4) -> List[AgentResponse]:
+        """Process several custom videos with a single batched test generation call"""
+        try:
+            logger.info(f"Processing batch of {len(video_urls)} custom videos")
+            
+            # Download concurrently, then transcribe one video at a time
+            transcripts = asyncio.run(self.video_processor.process_videos(video_urls, max_concurrent_downloads))
+            
+            responses: List[Optional[AgentResponse]] = [None] * len(video_urls)
+            batch_indices = []
+            processed_videos = []
+            for i, (video_url, (audio_path, transcript_data)) in enumerate(zip(video_urls, transcripts)):
+                if not audio_path:
+                    responses[i] = AgentResponse(
+                        success=False,
+                        message="Failed to download video",
+                        error="Video download failed"
+                    )
+                    continue
+                
+                if not transcript_data:
+                    responses[i] = AgentResponse(
+                        success=False,
+                        message="Failed to transcribe video",
+                        error="Video transcription failed"
+                    )
+                    continue
+                
+                batch_indices.append(i)
+                processed_videos.append(self.create_processed_video_from_url(video_url, transcript_data))
+            
+            if processed_videos:
+                batch_response = self.test_generator_agent.process({
+                    'mode': 'batch_test_cases',
+                    'test_type': 'custom',
+                    'processed_videos': processed_videos,
+                    'requirements': self._custom_video_requirements(requirements)
+                })
+                
+                if batch_response.success:
+                    video_responses = [AgentResponse(**response) for response in batch_response.data['responses']]
+                else:
+                    video_responses = [batch_response] * len(processed_videos)
+                
+                for i, video_response in zip(batch_indices, video_responses):
+                    responses[i] = video_response
+            
+            return responses
+            
+        except Exception as e:
+            logger.error(f"Custom video batch processing error: {e}")
+            return [
+                AgentResponse(
+                    success=False,
+                    message=f"Custom video batch processing failed: {str(e)}",
+                    error=str(e)
+                )
+                for _ in video_urls
+            ]
+    
+    async def run_custom_videos_async(self, video_urls: List[str], requirements: Dict[str, Any] = None,
+                                      max_concurrent_downloads: int = 4) -> List[AgentResponse]:
+        """Process several custom videos, overlapping downloads, transcription and test generation"""
+        # The RAG store is shared, so test generation runs one video at a time
+        generate_lock = asyncio.Lock()
+        
+        async def generate(video_url: str, audio_path: Optional[str], transcript_data: Optional[Dict]) -> AgentResponse:
+            try:
+                if not audio_path:
+                    return AgentResponse(
+                        success=False,
+                        message="Failed to download video",
+                        error="Video download failed"
+                    )
+                
+                if not transcript_data:
+                    return AgentResponse(
+                        success=False,
+                        message="Failed to transcribe video",
+                        error="Video transcription failed"
+                    )
+                
+                async with generate_lock:
+                    return await asyncio.to_thread(
+                        self._generate_custom_video_tests,
+                        video_url,
+                        transcript_data,
+                        requirements
+                    )
+                
+            except Exception as e:
+                logger.error(f"Custom video processing error: {e}")
+                return AgentResponse(
+                    success=False,
+                    message=f"Custom video processing failed: {str(e)}",
+                    error=str(e)
+                )
+        
+        logger.info(f"Processing {len(video_urls)} custom videos")
+        return await self.video_processor.process_videos(video_urls, max_concurrent_downloads, on_transcript=generate)
+    
+    def run_custom_videos(self, video_urls: List[str], requirements: Dict[str, Any] = None) -> List[AgentResponse]:
+        """Synchronous wrapper around run_custom_videos_async"""
+        return asyncio.run(self.run_custom_videos_async(video_urls, requirements))
+    
+    def create_processed_video_from_url(self, url: str, transcript_data: Dict) -> ProcessedVideo:
+        """Create ProcessedVideo from custom URL"""
+        # Same as create_processed_video, but without UI/flow extraction or saving
+        return build_processed_video(url, f"Custom Video - {url}", transcript_data, extract_ui=False)
     
     def get_pipeline_stats(self) -> Dict[str, Any]:
         """Get pipeline statistics"""
@@ -361,7 +515,7 @@ class QAAgentPipeline:
             }
         }
     
-    def process_recruter_video_complete(self) -> Dict[str, Any]:
+    def process_recruter_video_complete(self, progress_callback: Optional[Callable[[str, float], None]] = None) -> Dict[str, Any]:
         """
         Complete pipeline:
         1. Process video and generate test cases
@@ -369,13 +523,17 @@ class QAAgentPipeline:
         3. Prepare for execution
         4. Executes tests
         5. Generates Reports
+        
+        progress_callback, if given, is called with (message, fraction) as each step starts.
         """
+        report_progress = progress_callback or (lambda message, progress: None)
         try:
             logger.info("Starting complete Recruter.ai pipeline...")
             
             # Step 1: Process video and generate test cases and scripts
             logger.info("Step 1: Running full pipeline (video -> test cases -> scripts)...")
-            transcript_data = self.video_processor.process_recruter_video()
+            report_progress("Downloading and transcribing video...", 0.1)
+            transcript_data = self._cached_recruter_transcript()
             
             if not transcript_data:
                 return {
@@ -386,16 +544,18 @@ class QAAgentPipeline:
             
             # Step 2: Process transcript into structured format
             logger.info("Step 2: Processing transcript into structured format...")
-            processed_video = self.create_processed_video(transcript_data)
+            report_progress("Processing transcript into structured format...", 0.3)
+            processed_video = self._cached_recruter_processed_video(transcript_data)
             
             # Step 3: Run full pipeline using TestGeneratorAgent
             logger.info("Step 3: Generating test cases and Playwright scripts...")
+            report_progress("Generating test cases and Playwright scripts...", 0.4)
             test_generation_input = {
                 'mode': 'full_pipeline',
                 'processed_video': processed_video,
-                'requirements': self.get_default_requirements(),
+                'requirements': self.default_requirements,
                 'test_type': 'recruter_ai',
-                'output_dir': str(settings.get_test_output_dir('recruter_ai'))
+                'output_dir': self._recruter_dirs['tests_dir']
             }
             
             result = self.test_generator_agent.process(test_generation_input)
@@ -409,6 +569,7 @@ class QAAgentPipeline:
             
             # Step 4: Execute the generated test scripts
             logger.info("Step 4: Executing generated Playwright tests...")
+            report_progress("Executing tests...", 0.7)
 
             execution_response = self.execution_agent.process({
                 "test_type": "recruter_ai"
@@ -425,11 +586,14 @@ class QAAgentPipeline:
             
             # Step 5: Create execution summary
             logger.info("Step 5: Creating execution summary...")
+            report_progress("Creating execution summary...", 0.95)
             execution_summary = self.create_execution_summary(
                 result.data,
                 result.data.get('generation_result', {})
             )
             
+            report_progress("Pipeline complete", 1.0)
+            
             return {
                 'success': True,
                 'message': 'Complete pipeline finished successfully',
@@ -437,10 +601,7 @@ class QAAgentPipeline:
                     'test_generation': result.data,
                     'script_generation': result.data.get('generation_result', {}),
                     'execution_result': execution_response.data,
-                    'execution_summary': self.create_execution_summary(
-                        result.data,
-                        result.data.get('generation_result', {})
-                    ),
+                    'execution_summary': execution_summary,
                     'next_steps': self.get_next_steps(result.data)
                 }
             }
@@ -459,10 +620,9 @@ class QAAgentPipeline:
         stats = script_data.get('stats', {})
         
         # Count tests by type
-        test_breakdown = {}
-        for test_case in test_suite.get('test_cases', []):
-            test_type = test_case.get('test_type', 'functional')
-            test_breakdown[test_type] = test_breakdown.get(test_type, 0) + 1
+        test_breakdown = dict(Counter(
+            test_case.get('test_type', 'functional') for test_case in test_suite.get('test_cases', [])
+        ))
         
         return {
             'timestamp': datetime.now().isoformat(),
@@ -482,34 +642,39 @@ class QAAgentPipeline:
                 'output_directory': script_data.get('output_directory', 'Unknown'),
                 'generated_files': len(script_data.get('generated_files', []))
             },
-            'directory_structure': {
-                'tests_dir': str(settings.get_test_output_dir('recruter_ai')),
-                'reports_dir': str(settings.get_reports_dir('recruter_ai')),
-                'screenshots_dir': str(settings.SCREENSHOTS_DIR),
-                'videos_dir': str(settings.VIDEOS_TEST_DIR)
-            }
+            'directory_structure': dict(self._recruter_dirs)
         }
     
     def get_next_steps(self, script_data: Dict) -> List[str]:
         """Provide next steps for test execution"""
-        output_dir = script_data.get('output_directory', str(settings.get_test_output_dir('recruter_ai')))
+        output_dir = script_data.get('output_directory', self._recruter_dirs['tests_dir'])
+        reports_dir = self._recruter_dirs['reports_dir']
         
         return [
             f"1. Navigate to the Playwright base directory: cd {settings.PLAYWRIGHT_BASE_DIR}",
             "2. Install dependencies: npm install",
             "3. Install Playwright browsers: npx playwright install",
-            f"4. Run tests: npx playwright test --reporter=html --output-dir={settings.get_reports_dir('recruter_ai')}",
+            f"4. Run tests: npx playwright test --reporter=html --output-dir={reports_dir}",
             f"5. Run tests with UI: npx playwright test --ui",
-            f"6. View test report: npx playwright show-report {settings.get_reports_dir('recruter_ai')}",
+            f"6. View test report: npx playwright show-report {reports_dir}",
             f"7. Debug specific test: npx playwright test --debug {output_dir}/<test-file>",
             "",
             "Generated files structure:",
             f"📁 Tests: {output_dir}",
-            f"📁 Reports: {settings.get_reports_dir('recruter_ai')}",
-            f"📁 Screenshots: {settings.SCREENSHOTS_DIR}",
-            f"📁 Videos: {settings.VIDEOS_TEST_DIR}"
+            f"📁 Reports: {reports_dir}",
+            f"📁 Screenshots: {self._recruter_dirs['screenshots_dir']}",
+            f"📁 Videos: {self._recruter_dirs['videos_dir']}"
         ]
     
+    @staticmethod
+    def _load_json_file(json_file: Path):
+        """Load one JSON file, returning (data, None) or (None, error) so workers never raise"""
+        try:
+            with open(json_file, 'rb') as f:
+                return orjson.loads(f.read()), None
+        except Exception as e:
+            return None, e
+    
     def load_existing_test_cases(self, test_cases_path: str) -> List[Dict]:
         """Load test cases from JSON files"""
         try:
@@ -518,25 +683,28 @@ class QAAgentPipeline:
             
             if test_path.is_file():
                 # Single file
-                with open(test_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        test_cases.extend(data)
-                    else:
-                        test_cases.append(data)
+                data, error = self._load_json_file(test_path)
+                if error:
+                    raise error
+                loaded = [(test_path, data, None)]
             
             elif test_path.is_dir():
-                # Directory of JSON files
-                for json_file in test_path.glob('*.json'):
-                    try:
-                        with open(json_file, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            if isinstance(data, list):
-                                test_cases.extend(data)
-                            else:
-                                test_cases.append(data)
-                    except Exception as e:
-                        logger.warning(f"Failed to load {json_file}: {e}")
+                # Directory of JSON files, read concurrently since loading is I/O bound
+                json_files = list(test_path.glob('*.json'))
+                with ThreadPoolExecutor(max_workers=min(32, len(json_files) or 1)) as executor:
+                    results = executor.map(self._load_json_file, json_files)
+                    loaded = [(json_file, data, error) for json_file, (data, error) in zip(json_files, results)]
+            
+            else:
+                loaded = []
+            
+            for json_file, data, error in loaded:
+                if error:
+                    logger.warning(f"Failed to load {json_file}: {error}")
+                elif isinstance(data, list):
+                    test_cases.extend(data)
+                else:
+                    test_cases.append(data)
             
             logger.info(f"Loaded {len(test_cases)} test cases")
             return test_cases
@@ -606,11 +774,12 @@ def main_enhanced():
     parser.add_argument('--test-cases', type=str, help='Path to existing test cases (for scripts-only mode)')
     parser.add_argument('--output-dir', type=str, help='Output directory for generated scripts')
     parser.add_argument('--test-type', type=str, default='custom', help='Test type for organizing output')
+    parser.add_argument('--json', action='store_true', help='Write the raw result to stdout as JSON instead of the summary')
     
     args = parser.parse_args()
     
-    # Initialize pipeline
-    pipeline = QAAgentPipeline()
+    # Initialize pipeline; with --json, stdout is reserved for the result
+    pipeline = QAAgentPipeline({'quiet': args.json})
     
     if args.mode == 'full':
         # Full pipeline: video -> test cases -> scripts
@@ -648,94 +817,102 @@ def main_enhanced():
             args.test_type
         )
     
+    # Machine-readable output: encode the result once and write the bytes directly
+    if args.json:
+        sys.stdout.buffer.write(dumps_json(result, newline=True))
+        sys.stdout.buffer.flush()
+        return result
+    
     # Display results
     if isinstance(result, dict) and result.get('success'):
         logger.info("✅ Pipeline completed successfully!")
         
+        # Collect the report and write it to stdout in one go
+        out = []
+        
         if args.mode == 'full':
             data = result.get('data', {})
-            print("\n" + "="*60)
-            print("COMPLETE PIPELINE RESULTS")
-            print("="*60)
+            out.append("\n" + "="*60)
+            out.append("COMPLETE PIPELINE RESULTS")
+            out.append("="*60)
             
             # Test generation summary
             test_gen = data.get('test_generation', {})
             test_suite = test_gen.get('test_suite', {})
             
-            print(f"🎥 Video: {data.get('execution_summary', {}).get('video_info', {}).get('url', 'Unknown')}")
-            print(f"📊 Test Cases Generated: {len(test_suite.get('test_cases', []))}")
+            out.append(f"🎥 Video: {data.get('execution_summary', {}).get('video_info', {}).get('url', 'Unknown')}")
+            out.append(f"📊 Test Cases Generated: {len(test_suite.get('test_cases', []))}")
             
             # Script generation summary
             script_gen = data.get('script_generation', {})
             stats = script_gen.get('stats', {})
             
-            print(f"🎭 Playwright Scripts: {stats.get('successful', 0)} successful, {stats.get('failed', 0)} failed")
-            print(f"📁 Output Directory: {script_gen.get('output_dir', 'Unknown')}")
+            out.append(f"🎭 Playwright Scripts: {stats.get('successful', 0)} successful, {stats.get('failed', 0)} failed")
+            out.append(f"📁 Output Directory: {script_gen.get('output_dir', 'Unknown')}")
             
             # Directory structure
             dir_structure = data.get('execution_summary', {}).get('directory_structure', {})
             if dir_structure:
-                print(f"📁 Tests: {dir_structure.get('tests_dir', 'Unknown')}")
-                print(f"📁 Reports: {dir_structure.get('reports_dir', 'Unknown')}")
-                print(f"📁 Screenshots: {dir_structure.get('screenshots_dir', 'Unknown')}")
-                print(f"📁 Videos: {dir_structure.get('videos_dir', 'Unknown')}")
+                out.append(f"📁 Tests: {dir_structure.get('tests_dir', 'Unknown')}")
+                out.append(f"📁 Reports: {dir_structure.get('reports_dir', 'Unknown')}")
+                out.append(f"📁 Screenshots: {dir_structure.get('screenshots_dir', 'Unknown')}")
+                out.append(f"📁 Videos: {dir_structure.get('videos_dir', 'Unknown')}")
             
             # Next steps
             next_steps = data.get('next_steps', [])
             if next_steps:
-                print("\n📋 NEXT STEPS:")
-                for step in next_steps:
-                    print(f"   {step}")
+                out.append("\n📋 NEXT STEPS:")
+                out.extend(f"   {step}" for step in next_steps)
                     
         elif args.mode == 'generate-only':
             # Handle test generation only
             data = result.get('data', {})
             test_suite = data.get('test_suite', {})
             
-            print("\n" + "="*60)
-            print("TEST GENERATION RESULTS")
-            print("="*60)
-            print(f"📊 Test Cases Generated: {len(test_suite.get('test_cases', []))}")
-            print(f"📁 Output File: {data.get('output_path', 'Unknown')}")
+            out.append("\n" + "="*60)
+            out.append("TEST GENERATION RESULTS")
+            out.append("="*60)
+            out.append(f"📊 Test Cases Generated: {len(test_suite.get('test_cases', []))}")
+            out.append(f"📁 Output File: {data.get('output_path', 'Unknown')}")
             
             # Show test breakdown
-            test_breakdown = {}
-            for test_case in test_suite.get('test_cases', []):
-                test_type = test_case.get('test_type', 'functional')
-                test_breakdown[test_type] = test_breakdown.get(test_type, 0) + 1
+            test_breakdown = Counter(
+                test_case.get('test_type', 'functional') for test_case in test_suite.get('test_cases', [])
+            )
             
             if test_breakdown:
-                print("\n📈 Test Breakdown:")
-                for test_type, count in test_breakdown.items():
-                    print(f"   {test_type}: {count}")
+                out.append("\n📈 Test Breakdown:")
+                out.extend(f"   {test_type}: {count}" for test_type, count in test_breakdown.items())
                     
         elif args.mode == 'scripts-only':
             # Handle script generation only
             data = result.get('data', {})
             stats = data.get('stats', {})
             
-            print("\n" + "="*60)
-            print("SCRIPT GENERATION RESULTS")
-            print("="*60)
-            print(f"🎭 Playwright Scripts: {stats.get('successful', 0)} successful, {stats.get('failed', 0)} failed")
-            print(f"📁 Output Directory: {data.get('output_dir', 'Unknown')}")
+            out.append("\n" + "="*60)
+            out.append("SCRIPT GENERATION RESULTS")
+            out.append("="*60)
+            out.append(f"🎭 Playwright Scripts: {stats.get('successful', 0)} successful, {stats.get('failed', 0)} failed")
+            out.append(f"📁 Output Directory: {data.get('output_dir', 'Unknown')}")
             
             # Show generated files
             generated_files = data.get('generated_files', [])
             if generated_files:
-                print(f"\n📄 Generated Files ({len(generated_files)}):")
-                for file in generated_files[:10]:  # Show first 10
-                    print(f"   - {file}")
+                out.append(f"\n📄 Generated Files ({len(generated_files)}):")
+                out.extend(f"   - {file}" for file in generated_files[:10])  # Show first 10
                 if len(generated_files) > 10:
-                    print(f"   ... and {len(generated_files) - 10} more")
+                    out.append(f"   ... and {len(generated_files) - 10} more")
                 
             # Next steps
             next_steps = data.get('next_steps', [])
             if next_steps:
-                print("\n📋 NEXT STEPS:")
-                for step in next_steps:
-                    print(f"   {step}")
-                    
+                out.append("\n📋 NEXT STEPS:")
+                out.extend(f"   {step}" for step in next_steps)
+        
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
+            sys.stdout.flush()
+    
     else:
         # Handle failures
         error_msg = result.get('message', 'Unknown error') if isinstance(result, dict) else str(result)
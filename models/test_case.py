@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+import sys
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 from typing import List, Dict, Optional
 from enum import Enum
 
@@ -21,6 +22,12 @@ class TestStep(BaseModel):
     expected_result: Optional[str] = Field(None, description="Expected result after this step")
     wait_condition: Optional[str] = Field(None, description="Condition to wait for")
     screenshot: bool = Field(False, description="Whether to take screenshot after this step")
+    
+    # Actions and selectors come from a small vocabulary, so share one string object per value
+    @field_validator('action', 'selector')
+    @classmethod
+    def _intern_text(cls, value: str) -> str:
+        return sys.intern(value)
 
 class TestCase(BaseModel):
     id: str = Field(..., description="Unique test case identifier")
@@ -35,6 +42,11 @@ class TestCase(BaseModel):
     browser_compatibility: List[str] = Field(default_factory=list, description="Compatible browsers")
     estimated_duration: Optional[int] = Field(None, description="Estimated duration in seconds")
     
+    @field_validator('tags')
+    @classmethod
+    def _intern_tags(cls, value: List[str]) -> List[str]:
+        return [sys.intern(tag) for tag in value]
+    
     class Config:
         use_enum_values = True
 
@@ -121,4 +133,8 @@ class TestSuiteResult(BaseModel):
     report_path: Optional[str] = Field(None, description="Path to test report")
     
     class Config:
-        use_enum_values = True
\ No newline at end of file
+        use_enum_values = True
+
+# Validators built once at import and reused for untrusted payloads
+TEST_CASE_ADAPTER = TypeAdapter(TestCase)
+TEST_SUITE_ADAPTER = TypeAdapter(TestSuite)
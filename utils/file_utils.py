@@ -1,13 +1,66 @@
-import json
+import os
+import asyncio
+import functools
+import threading
+import orjson
+import msgspec
+import zstandard
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, Iterator, Optional, Set, Type, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Files ending in .zst are zstd-compressed; compressor instances are not safe to share across threads
+_ZSTD_SUFFIX = '.zst'
+_zstd_compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+_zstd_compressor_lock = threading.Lock()
+
+# Directories already created by this process, so repeated saves skip the mkdir syscalls
+_ensured_dirs: Set[Path] = set()
+
+def _ensure_dir(directory: Path) -> None:
+    """Create directory (and parents) once per process"""
+    if directory not in _ensured_dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(directory)
+
+def _encode_json(data: Dict[str, Any], file_path: Path) -> bytes:
+    """Encode data for save_json, compressing it when the path ends in .zst"""
+    # Unknown types fall back to their string form
+    payload = orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+    if file_path.name.endswith(_ZSTD_SUFFIX):
+        with _zstd_compressor_lock:
+            payload = _zstd_compressor.compress(payload)
+    return payload
+
+def _write_bytes(payload: bytes, file_path: Path, mode: str = 'wb') -> None:
+    """Write or append payload, creating the parent directory first if needed"""
+    _ensure_dir(file_path.parent)
+    
+    try:
+        with open(file_path, mode) as f:
+            f.write(payload)
+    except FileNotFoundError:
+        # The directory was removed after we first created it
+        _ensured_dirs.discard(file_path.parent)
+        _ensure_dir(file_path.parent)
+        with open(file_path, mode) as f:
+            f.write(payload)
+
+def _write_atomic(payload: bytes, file_path: Path) -> None:
+    """Write payload to a temp file, then swap it in so readers never see a partial file"""
+    tmp_path = file_path.with_name(file_path.name + '.tmp')
+    _write_bytes(payload, tmp_path)
+    os.replace(tmp_path, file_path)
+
 def save_json(data: Dict[str, Any], file_path: Union[str, Path]) -> None:
     """
-    Save dictionary data to a JSON file.
+    Save dictionary data to a JSON file, zstd-compressed if the path ends in .zst.
     
     Args:
         data: Dictionary to save as JSON
@@ -17,12 +70,30 @@ def save_json(data: Dict[str, Any], file_path: Union[str, Path]) -> None:
         # Convert Path object to string if necessary
         file_path = Path(file_path)
         
-        # Ensure parent directory exists
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(_encode_json(data, file_path), file_path)
+        
+        logger.info(f"Successfully saved JSON to {file_path}")
+        
+    except Exception as e:
+        logger.error(f"Error saving JSON to {file_path}: {e}")
+        raise
+
+async def save_json_async(data: Dict[str, Any], file_path: Union[str, Path]) -> None:
+    """
+    Save dictionary data to a JSON file without blocking the event loop on disk I/O.
+    
+    Encoding runs on the loop; the write and rename run in a worker thread, so
+    independent artifacts can be saved concurrently with asyncio.gather.
+    
+    Args:
+        data: Dictionary to save as JSON
+        file_path: Path to the output JSON file
+    """
+    try:
+        file_path = Path(file_path)
         
-        # Write JSON data to file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        payload = _encode_json(data, file_path)
+        await asyncio.to_thread(_write_atomic, payload, file_path)
         
         logger.info(f"Successfully saved JSON to {file_path}")
         
@@ -30,9 +101,25 @@ def save_json(data: Dict[str, Any], file_path: Union[str, Path]) -> None:
         logger.error(f"Error saving JSON to {file_path}: {e}")
         raise
 
+@functools.lru_cache(maxsize=128)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a JSON file; keyed on mtime and size so rewritten files are re-read"""
+    with open(path_str, 'rb') as f:
+        raw = f.read()
+    if path_str.endswith(_ZSTD_SUFFIX):
+        raw = zstandard.ZstdDecompressor().decompress(raw)
+    return orjson.loads(raw)
+
+def clear_json_cache() -> None:
+    """Drop every parsed file cached by load_json"""
+    _load_json_cached.cache_clear()
+
 def load_json(file_path: Union[str, Path]) -> Dict[str, Any]:
     """
-    Load JSON data from a file.
+    Load JSON data from a file, decompressing it first if the path ends in .zst.
+    
+    Parsed files are cached until they change on disk, so repeated loads return
+    the same object; callers must copy it before mutating.
     
     Args:
         file_path: Path to the JSON file
@@ -42,7 +129,7 @@ def load_json(file_path: Union[str, Path]) -> Dict[str, Any]:
         
     Raises:
         FileNotFoundError: If the file does not exist
-        json.JSONDecodeError: If the file contains invalid JSON
+        orjson.JSONDecodeError: If the file contains invalid JSON
     """
     try:
         file_path = Path(file_path)
@@ -50,12 +137,178 @@ def load_json(file_path: Union[str, Path]) -> Dict[str, Any]:
         if not file_path.exists():
             raise FileNotFoundError(f"JSON file not found: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        stat = file_path.stat()
+        data = _load_json_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
         
         logger.info(f"Successfully loaded JSON from {file_path}")
         return data
         
     except Exception as e:
         logger.error(f"Error loading JSON from {file_path}: {e}")
-        raise
\ No newline at end of file
+        raise
+
+# MessagePack files are a sequence of frames, each a 4-byte big-endian length followed by the payload
+_MSGPACK_HEADER_SIZE = 4
+
+def _encode_unknown(obj: Any) -> Any:
+    """Encode pydantic models and other unknown types for msgspec and orjson"""
+    if hasattr(obj, 'model_dump'):
+        return obj.model_dump()
+    return str(obj)
+
+_msgpack_encoder = msgspec.msgpack.Encoder(enc_hook=_encode_unknown)
+_msgpack_decoder = msgspec.msgpack.Decoder()
+
+def _msgpack_frame(data: Any) -> bytes:
+    """Encode data as a single length-prefixed MessagePack frame"""
+    payload = _msgpack_encoder.encode(data)
+    return len(payload).to_bytes(_MSGPACK_HEADER_SIZE, 'big') + payload
+
+def save_msgpack(data: Any, file_path: Union[str, Path]) -> None:
+    """
+    Save data to a MessagePack file as a single frame.
+    
+    Intended for intermediate artifacts that are only read back by the pipeline;
+    user-facing output should keep using save_json.
+    
+    Args:
+        data: Data (dicts, lists or pydantic models) to save
+        file_path: Path to the output MessagePack file
+    """
+    try:
+        file_path = Path(file_path)
+        
+        _write_atomic(_msgpack_frame(data), file_path)
+        
+        logger.info(f"Successfully saved MessagePack to {file_path}")
+        
+    except Exception as e:
+        logger.error(f"Error saving MessagePack to {file_path}: {e}")
+        raise
+
+def append_msgpack(data: Any, file_path: Union[str, Path]) -> None:
+    """
+    Append data to a MessagePack file as a new frame.
+    
+    Args:
+        data: Data (dicts, lists or pydantic models) to append
+        file_path: Path to the MessagePack file, created if missing
+    """
+    try:
+        file_path = Path(file_path)
+        _write_bytes(_msgpack_frame(data), file_path, 'ab')
+        
+    except Exception as e:
+        logger.error(f"Error appending MessagePack to {file_path}: {e}")
+        raise
+
+def iter_msgpack(file_path: Union[str, Path]) -> Iterator[Any]:
+    """
+    Yield each frame of a MessagePack file in order.
+    
+    Args:
+        file_path: Path to the MessagePack file
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file ends in a truncated frame
+    """
+    file_path = Path(file_path)
+    
+    if not file_path.exists():
+        raise FileNotFoundError(f"MessagePack file not found: {file_path}")
+    
+    with open(file_path, 'rb') as f:
+        while header := f.read(_MSGPACK_HEADER_SIZE):
+            size = int.from_bytes(header, 'big')
+            payload = f.read(size)
+            if len(header) < _MSGPACK_HEADER_SIZE or len(payload) < size:
+                raise ValueError(f"Truncated MessagePack frame in {file_path}")
+            yield _msgpack_decoder.decode(payload)
+
+def load_msgpack(file_path: Union[str, Path], model: Optional[Type[Any]] = None) -> Any:
+    """
+    Load the first frame of a MessagePack file.
+    
+    Args:
+        file_path: Path to the MessagePack file
+        model: Optional pydantic model class to validate the decoded data into
+        
+    Returns:
+        The decoded data, or an instance of model if one was given
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file is empty or truncated
+    """
+    try:
+        data = next(iter_msgpack(file_path), None)
+        if data is None:
+            raise ValueError(f"Empty MessagePack file: {file_path}")
+        
+        logger.info(f"Successfully loaded MessagePack from {file_path}")
+        return model.model_validate(data) if model is not None else data
+        
+    except Exception as e:
+        logger.error(f"Error loading MessagePack from {file_path}: {e}")
+        raise
+
+def dumps_json(data: Any, newline: bool = False) -> bytes:
+    """
+    Encode data as compact JSON bytes, dumping pydantic models along the way.
+    
+    Args:
+        data: Data (dicts, lists or pydantic models) to encode
+        newline: Whether to terminate the output with a newline
+    """
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if newline:
+        option |= orjson.OPT_APPEND_NEWLINE
+    return orjson.dumps(data, default=_encode_unknown, option=option)
+
+def append_ndjson(data: Any, file_path: Union[str, Path]) -> None:
+    """
+    Append data to an NDJSON file as a single line.
+    
+    Args:
+        data: Data (dicts, lists or pydantic models) to append
+        file_path: Path to the NDJSON file, created if missing
+    """
+    try:
+        file_path = Path(file_path)
+        _write_bytes(dumps_json(data, newline=True), file_path, 'ab')
+        
+    except Exception as e:
+        logger.error(f"Error appending NDJSON to {file_path}: {e}")
+        raise
+
+def iter_ndjson(file_path: Union[str, Path]) -> Iterator[Any]:
+    """
+    Yield each record of an NDJSON file in order, skipping blank lines.
+    
+    Args:
+        file_path: Path to the NDJSON file
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    file_path = Path(file_path)
+    
+    if not file_path.exists():
+        raise FileNotFoundError(f"NDJSON file not found: {file_path}")
+    
+    with open(file_path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+def finalize_ndjson(file_path: Union[str, Path], output_path: Union[str, Path], key: str = 'items') -> None:
+    """
+    Collect the records of an NDJSON file into a single JSON document.
+    
+    Args:
+        file_path: Path to the NDJSON file
+        output_path: Path to the output JSON file
+        key: Key under which the records are stored in the output document
+    """
+    save_json({key: list(iter_ndjson(file_path))}, output_path)